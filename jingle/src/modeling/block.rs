@@ -70,13 +70,11 @@ impl<'ctx> ModeledBlock<'ctx> {
         let state = original_state.clone();
 
         let mut block_terminated = false;
-        let mut ops = Vec::new();
         let mut instructions = Vec::new();
         // The block_terminated check ensures that this function will only return successfully
         // in cases where this has been initialized with an actual value.
         let mut naive_fallthrough_address: u64 = 0;
         for instr in instr_iter {
-            ops.extend_from_slice(&instr.ops);
             if instr.terminates_basic_block() {
                 block_terminated = true;
                 naive_fallthrough_address = instr.next_addr();
@@ -103,9 +101,12 @@ impl<'ctx> ModeledBlock<'ctx> {
             inputs: Default::default(),
             outputs: Default::default(),
         };
-        for op in ops {
-            model.model_pcode_op(&op)?
+        // move the instructions out while modeling them rather than copying every op
+        let instructions = std::mem::take(&mut model.instructions);
+        for op in instructions.iter().flat_map(|i| i.ops.iter()) {
+            model.model_pcode_op(op)?
         }
+        model.instructions = instructions;
         Ok(model)
     }
 
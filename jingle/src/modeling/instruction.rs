@@ -45,9 +45,12 @@ impl<'ctx> ModeledInstruction<'ctx> {
             outputs: Default::default(),
             branch_builder: BranchConstraint::new(&next_vn),
         };
-        for x in model.instr.clone().ops.iter() {
+        // move the ops out while modeling them rather than cloning the whole instruction
+        let ops = std::mem::take(&mut model.instr.ops);
+        for x in ops.iter() {
             model.model_pcode_op(x)?;
         }
+        model.instr.ops = ops;
         Ok(model)
     }
 
@@ -131,10 +131,11 @@ pub trait ModelingContext<'ctx>: SpaceManager + Debug + Sized {
         {
             let ours = self.get_final_state().read_resolved(vn)?;
             let other = other.get_final_state().read_resolved(vn)?;
-            output_terms.push(ours._eq(&other).simplify());
+            output_terms.push(ours._eq(&other));
         }
         let imp_terms: Vec<&Bool> = output_terms.iter().collect();
-        let outputs_pairwise_equal = Bool::and(self.get_z3(), imp_terms.as_slice());
+        // simplify the conjunction once rather than each term on its own
+        let outputs_pairwise_equal = Bool::and(self.get_z3(), imp_terms.as_slice()).simplify();
         Ok(outputs_pairwise_equal)
     }
 
@@ -154,10 +155,10 @@ pub trait ModelingContext<'ctx>: SpaceManager + Debug + Sized {
         {
             let other = other.get_original_state().get_space(i)?;
             let space = self.get_final_state().get_space(i)?;
-            terms.push(space._eq(other).simplify())
+            terms.push(space._eq(other))
         }
         let eq_terms: Vec<&Bool> = terms.iter().collect();
-        Ok(Bool::and(self.get_z3(), eq_terms.as_slice()))
+        Ok(Bool::and(self.get_z3(), eq_terms.as_slice()).simplify())
     }
 
     /// Returns an assertion that [other]'s end-branch behavior is able to branch to the same destination
@@ -179,13 +180,16 @@ pub trait ModelingContext<'ctx>: SpaceManager + Debug + Sized {
             let self_bv_metadata =
                 zext_to_match(self_bv_metadata.simplify(), &other_bv_metadata.simplify());
             let other_bv_metadata = zext_to_match(other_bv_metadata, &self_bv_metadata);
-            Ok(Some(Bool::and(
-                self.get_z3(),
-                &[
-                    &self_bv._eq(&other_bv).simplify(),
-                    &self_bv_metadata._eq(&other_bv_metadata).simplify(),
-                ],
-            )))
+            Ok(Some(
+                Bool::and(
+                    self.get_z3(),
+                    &[
+                        &self_bv._eq(&other_bv),
+                        &self_bv_metadata._eq(&other_bv_metadata),
+                    ],
+                )
+                .simplify(),
+            ))
         }
     }
     /// Returns a [Bool] assertion that the given trace's end-branch behavior is able to
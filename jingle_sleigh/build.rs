@@ -1,22 +1,12 @@
+use std::env;
 use std::fs;
 use std::fs::copy;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
+use std::time::SystemTime;
 fn main() {
     if cfg!(target_os = "macos") {
         println!("cargo::rustc-link-search=/opt/homebrew/lib")
     }
-    if !cpp_src_path().exists() {
-        let submod = submod_path();
-        if !submod.read_dir().is_ok_and(|f| f.count() != 0) {
-            panic!(
-                "SLEIGH sources not found! This likely means that you are developing on a fresh \
-            clone of jingle and need to pull in the SLEIGH sources. Please run: \n\
-            git submodule init && git submodule update"
-            )
-        }
-        copy_sources();
-    }
-
     let mut rust_sources = vec![
         "src/ffi/addrspace.rs",
         "src/ffi/context_ffi.rs",
@@ -50,16 +40,34 @@ fn main() {
         "src/ffi/cpp/addrspace_handle.cpp",
         "src/ffi/cpp/addrspace_manager_handle.cpp",
     ];
-    if cfg!(compile) {
+    // SLEIGH's compiler is vendored even when it is not built, so that the packaged crate and the
+    // CMake project always have it
+    let slgh_compile = "src/ffi/cpp/sleigh/slgh_compile.cc";
+    let mut vendored_sources = cpp_sources.clone();
+    vendored_sources.push(slgh_compile);
+    // features reach build scripts through the environment, not through cfg
+    if env::var_os("CARGO_FEATURE_COMPILE").is_some() {
         rust_sources.push("src/ffi/compile.rs");
         cpp_sources.push("src/ffi/cpp/compile.cpp");
-        cpp_sources.push("src/ffi/cpp/sleigh/slgh_compile.cc");
+        cpp_sources.push(slgh_compile);
     }
+    if !sources_present(&vendored_sources) || sources_stale() {
+        let submod = submod_path();
+        if !submod.read_dir().is_ok_and(|f| f.count() != 0) {
+            panic!(
+                "SLEIGH sources not found! This likely means that you are developing on a fresh \
+            clone of jingle and need to pull in the SLEIGH sources. Please run: \n\
+            git submodule init && git submodule update"
+            )
+        }
+        copy_sources(&vendored_sources);
+    }
+
     // This assumes all your C++ bindings are in lib
-    cxx_build::bridges(rust_sources)
+    cxx_build::bridges(&rust_sources)
         .files(cpp_sources)
         .flag_if_supported("-std=c++17")
-        .flag_if_supported("-Dmain=c_main")
+        .define("main", "c_main")
         .flag_if_supported("-Wno-unused-parameter")
         .flag_if_supported("-Wno-unused-function")
         .flag_if_supported("-Wno-unneeded-internal-declaration")
@@ -70,28 +78,71 @@ fn main() {
         .compile("jingle_sleigh");
 
     println!("cargo::rerun-if-changed=src/ffi/cpp/");
-    println!("cargo::rerun-if-changed=src/ffi/addrspace.rs");
-    println!("cargo::rerun-if-changed=src/ffi/compile.rs");
-    println!("cargo::rerun-if-changed=src/ffi/context_ffi.rs");
-    println!("cargo::rerun-if-changed=src/ffi/instruction.rs");
+    for source in &rust_sources {
+        println!("cargo::rerun-if-changed={}", source);
+    }
     println!(
         "cargo::rerun-if-changed={}",
         ghidra_cpp_path().to_str().unwrap()
     );
 }
 
-fn copy_sources() {
-    fs::create_dir(cpp_src_path()).unwrap();
+/// Copies the SLEIGH headers and only those `.cc` files that we vendor; the decompiler directory
+/// holds many more translation units than SLEIGH needs.
+///
+/// The files are staged in a scratch directory that is only renamed into place once complete, so
+/// an interrupted build can never leave a half-populated source directory behind.
+fn copy_sources(vendored_sources: &[&str]) {
+    let staging = cpp_staging_path();
+    if staging.exists() {
+        fs::remove_dir_all(&staging).unwrap();
+    }
+    fs::create_dir_all(&staging).unwrap();
     for path in fs::read_dir(ghidra_cpp_path()).unwrap().flatten() {
         if let Some(name) = path.file_name().to_str() {
-            if name.ends_with(".cc") || name.ends_with(".hh") || name.ends_with(".h") {
-                let mut result = cpp_src_path();
-                result.push(name);
-                copy(path.path().as_path(), result.as_path()).unwrap();
-                println!("Copying {}", name)
+            let mut result = cpp_src_path();
+            result.push(name);
+            let wanted = if name.ends_with(".cc") {
+                vendored_sources.iter().any(|s| Path::new(s) == result)
+            } else {
+                name.ends_with(".hh") || name.ends_with(".h")
+            };
+            if wanted {
+                copy(path.path().as_path(), staging.join(name).as_path()).unwrap();
             }
         }
     }
+    if cpp_src_path().exists() {
+        fs::remove_dir_all(cpp_src_path()).unwrap();
+    }
+    fs::rename(&staging, cpp_src_path()).unwrap();
+}
+
+/// Checks that every C++ source we are about to compile is actually on disk, rather than just
+/// the directory they are copied into, so that a partial copy gets redone.
+fn sources_present(sources: &[&str]) -> bool {
+    sources.iter().all(|s| Path::new(s).is_file())
+}
+
+/// Checks whether any vendored file, header or source, is older than its counterpart in the
+/// submodule checkout. Files with no counterpart (e.g. when building from a published crate,
+/// where the submodule is absent) are never considered stale.
+fn sources_stale() -> bool {
+    let vendored = match fs::read_dir(cpp_src_path()) {
+        Ok(vendored) => vendored,
+        Err(_) => return false,
+    };
+    vendored.flatten().any(|entry| {
+        let upstream = ghidra_cpp_path().join(entry.file_name());
+        match (modified(&entry.path()), modified(&upstream)) {
+            (Some(ours), Some(theirs)) => ours < theirs,
+            _ => false,
+        }
+    })
+}
+
+fn modified(path: &Path) -> Option<SystemTime> {
+    fs::metadata(path).and_then(|m| m.modified()).ok()
 }
 
 fn cpp_src_path() -> PathBuf {
@@ -103,6 +154,12 @@ fn cpp_src_path() -> PathBuf {
     p
 }
 
+fn cpp_staging_path() -> PathBuf {
+    let mut p = cpp_src_path();
+    p.set_extension("tmp");
+    p
+}
+
 fn submod_path() -> PathBuf {
     let mut p = PathBuf::new();
     p.push("ghidra");
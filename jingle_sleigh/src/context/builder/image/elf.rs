@@ -25,9 +25,12 @@ impl<'data, E: EndianParse> TryFrom<ElfBytes<'data, E>> for Image {
                 write: (flags & PF_W) == PF_W,
                 read: (flags & PF_R) == PF_R,
             };
-            let mut data = vec![0; mem_size as usize];
+            // write the file-backed bytes once and only zero-fill the remainder (e.g. .bss),
+            // rather than zeroing the whole segment and then copying over it
             let len = min(mem_size as usize, file_data.len());
-            data[0..len].copy_from_slice(&file_data[0..len]);
+            let mut data = Vec::with_capacity(mem_size as usize);
+            data.extend_from_slice(&file_data[0..len]);
+            data.resize(mem_size as usize, 0);
             img.sections.push(ImageSection {
                 perms,
                 base_address: addr as usize,
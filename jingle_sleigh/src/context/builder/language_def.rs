@@ -2,6 +2,7 @@ use crate::error::JingleSleighError;
 use crate::error::JingleSleighError::LanguageSpecRead;
 use serde::Deserialize;
 use std::fs::File;
+use std::io::BufReader;
 use std::path::{Path, PathBuf};
 
 #[derive(Clone, Debug, Deserialize)]
@@ -52,7 +53,7 @@ struct LanguageDefinitions {
 
 pub(super) fn parse_ldef(path: &Path) -> Result<Vec<LanguageDefinition>, JingleSleighError> {
     let file = File::open(path).map_err(|_| LanguageSpecRead)?;
-    let def: LanguageDefinitions = serde_xml_rs::from_reader(file)?;
+    let def: LanguageDefinitions = serde_xml_rs::from_reader(BufReader::new(file))?;
     Ok(def.language_definitions)
 }
 
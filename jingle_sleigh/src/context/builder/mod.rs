@@ -27,9 +27,20 @@ impl SleighContextBuilder {
     fn get_language(&self, id: &str) -> Option<&(LanguageDefinition, PathBuf)> {
         self.defs.iter().find(|(p, _)| p.id.eq(id))
     }
-    #[instrument(skip_all, fields(%id))]
     pub fn build(mut self, id: &str) -> Result<SleighContext, JingleSleighError> {
         let image = self.image.take().ok_or(NoImageProvided)?;
+        self.build_with_image(id, image)
+    }
+
+    /// Build a [`SleighContext`] for the given language id and image. This borrows the builder so
+    /// that one loaded set of language definitions can be reused for many contexts, instead of
+    /// re-parsing a whole ghidra installation for each one.
+    #[instrument(skip_all, fields(%id))]
+    pub fn build_with_image(
+        &self,
+        id: &str,
+        image: Image,
+    ) -> Result<SleighContext, JingleSleighError> {
         let (lang, path) = self.get_language(id).ok_or(InvalidLanguageId)?;
         let sla_path = path.join(&lang.sla_file);
         let mut context = SleighContext::new(&sla_path, image)?;
@@ -58,10 +69,7 @@ impl SleighContextBuilder {
         }
         let ldef_path = find_ldef(&path)?;
         let defs = parse_ldef(ldef_path.as_path())?;
-        let defs = defs
-            .iter()
-            .map(|f| (f.clone(), path.to_path_buf()))
-            .collect();
+        let defs = defs.into_iter().map(|f| (f, path.clone())).collect();
         Ok(defs)
     }
 
@@ -88,18 +96,17 @@ impl SleighContextBuilder {
 }
 
 fn find_ldef(path: &Path) -> Result<PathBuf, JingleSleighError> {
-    for entry in (fs::read_dir(path).map_err(|_| LanguageSpecRead)?).flatten() {
-        if let Some(e) = entry.path().extension() {
-            if e == "ldefs" {
-                return Ok(entry.path().clone());
-            }
-        }
-    }
-    Err(LanguageSpecRead)
+    fs::read_dir(path)
+        .map_err(|_| LanguageSpecRead)?
+        .flatten()
+        .map(|entry| entry.path())
+        .find(|p| p.extension().is_some_and(|e| e == "ldefs"))
+        .ok_or(LanguageSpecRead)
 }
 
 #[cfg(test)]
 mod tests {
+    use crate::context::builder::image::Image;
     use crate::context::builder::processor_spec::parse_pspec;
     use crate::context::builder::{parse_ldef, SleighContextBuilder};
 
@@ -146,4 +153,22 @@ mod tests {
         assert!(langs.get_language("sdf").is_none());
         assert!(langs.get_language(SLEIGH_ARCH).is_some());
     }
+
+    #[test]
+    fn test_build_with_image() {
+        let builder =
+            SleighContextBuilder::load_ghidra_installation("/Applications/ghidra").unwrap();
+        let nop: [u8; 1] = [0x90];
+        let ret: [u8; 1] = [0xc3];
+        let nop_ctx = builder
+            .build_with_image(SLEIGH_ARCH, Image::from(nop.as_slice()))
+            .unwrap();
+        let ret_ctx = builder
+            .build_with_image(SLEIGH_ARCH, Image::from(ret.as_slice()))
+            .unwrap();
+        let nop_instr = nop_ctx.read(0, 1).last().unwrap();
+        let ret_instr = ret_ctx.read(0, 1).last().unwrap();
+        assert!(nop_instr.disassembly.mnemonic.eq("NOP"));
+        assert!(ret_instr.disassembly.mnemonic.eq("RET"));
+    }
 }
@@ -2,6 +2,7 @@ use crate::error::JingleSleighError;
 use crate::error::JingleSleighError::LanguageSpecRead;
 use serde::Deserialize;
 use std::fs::File;
+use std::io::BufReader;
 use std::path::Path;
 
 #[derive(Debug, Deserialize)]
@@ -34,7 +35,7 @@ pub struct ProcessorSpec {
 
 pub(super) fn parse_pspec(path: &Path) -> Result<ProcessorSpec, JingleSleighError> {
     let file = File::open(path).map_err(|_| LanguageSpecRead)?;
-    let def: ProcessorSpec = serde_xml_rs::from_reader(file)?;
+    let def: ProcessorSpec = serde_xml_rs::from_reader(BufReader::new(file))?;
     Ok(def)
 }
 
@@ -15,12 +15,16 @@ use crate::ffi::context_ffi::CTX_BUILD_MUTEX;
 use crate::ffi::instruction::bridge::VarnodeInfoFFI;
 use crate::VarNode;
 use cxx::{SharedPtr, UniquePtr};
+use std::collections::HashMap;
 use std::fmt::{Debug, Formatter};
 use std::path::Path;
 
 pub struct SleighContext {
     ctx: UniquePtr<ContextFFI>,
     spaces: Vec<SpaceInfo>,
+    default_code_space_index: usize,
+    registers: Vec<(VarNode, String)>,
+    registers_by_name: HashMap<String, VarNode>,
     pub image: Image,
 }
 
@@ -40,17 +44,13 @@ impl SpaceManager for SleighContext {
     }
 
     fn get_code_space_idx(&self) -> usize {
-        self.ctx
-            .getSpaceByIndex(0)
-            .getManager()
-            .getDefaultCodeSpace()
-            .getIndex() as usize
+        self.default_code_space_index
     }
 }
 
 impl RegisterManager for SleighContext {
     fn get_register(&self, name: &str) -> Option<VarNode> {
-        self.ctx.getRegister(name).map(|f| VarNode::from(f)).ok()
+        self.registers_by_name.get(name).cloned()
     }
 
     fn get_register_name(&self, location: VarNode) -> Option<&str> {
@@ -65,11 +65,7 @@ impl RegisterManager for SleighContext {
     }
 
     fn get_registers(&self) -> Vec<(VarNode, String)> {
-        self.ctx
-            .getRegisters()
-            .iter()
-            .map(|b| (VarNode::from(&b.varnode), b.name.clone()))
-            .collect()
+        self.registers.clone()
     }
 }
 
@@ -84,7 +80,32 @@ impl SleighContext {
                 for idx in 0..ctx.getNumSpaces() {
                     spaces.push(SpaceInfo::from(ctx.getSpaceByIndex(idx)));
                 }
-                Ok(Self { image, ctx, spaces })
+                // this is asked for every time a new State is modeled, so resolve it once
+                // here instead of walking through the FFI on every call
+                let default_code_space_index = ctx
+                    .getSpaceByIndex(0)
+                    .getManager()
+                    .getDefaultCodeSpace()
+                    .getIndex() as usize;
+                // sleigh's register table is fixed once the context is built, so fetch it in one
+                // go rather than crossing the FFI for every lookup by name
+                let registers: Vec<(VarNode, String)> = ctx
+                    .getRegisters()
+                    .iter()
+                    .map(|b| (VarNode::from(&b.varnode), b.name.clone()))
+                    .collect();
+                let registers_by_name = registers
+                    .iter()
+                    .map(|(vn, name)| (name.clone(), vn.clone()))
+                    .collect();
+                Ok(Self {
+                    image,
+                    ctx,
+                    spaces,
+                    default_code_space_index,
+                    registers,
+                    registers_by_name,
+                })
             }
             Err(_) => Err(SleighInitError),
         }
@@ -147,7 +168,7 @@ impl<'a> Iterator for SleighContextInstructionIterator<'a> {
 
 #[cfg(test)]
 mod test {
-    use crate::context::builder::image::Image;
+    use crate::context::builder::image::{Image, ImageSection, Perms};
     use crate::context::builder::SleighContextBuilder;
     use crate::pcode::PcodeOperation;
     use crate::SpaceManager;
@@ -175,4 +196,65 @@ mod test {
         };
         assert!(matches!(&instr.ops[0], _op))
     }
+
+    #[test]
+    fn get_one_past_section_end() {
+        // `mov eax, 1` cut off after its first immediate byte, in a section not based at 0; the
+        // fetch runs past the end of the section, and the missing bytes must read as zero
+        let mov_eax_1: [u8; 2] = [0xb8, 0x01];
+        let image = Image {
+            sections: vec![ImageSection {
+                data: mov_eax_1.to_vec(),
+                base_address: 0x1000,
+                perms: Perms {
+                    read: true,
+                    write: false,
+                    exec: true,
+                },
+            }],
+        };
+        let ctx_builder =
+            SleighContextBuilder::load_ghidra_installation("/Applications/ghidra").unwrap();
+        let ctx = ctx_builder.set_image(image).build(SLEIGH_ARCH).unwrap();
+        let instr = ctx.read(0x1000, 1).last().unwrap();
+        assert_eq!(instr.length, 5);
+        assert!(instr.disassembly.mnemonic.eq("MOV"));
+        let op = PcodeOperation::Copy {
+            input: varnode!(&ctx, #1:4).unwrap(),
+            output: varnode!(&ctx, "register"[0]:4).unwrap(),
+        };
+        assert!(instr.ops.contains(&op))
+    }
+
+    #[test]
+    fn get_one_across_sections() {
+        // `mov eax, 0x01020304` split over two adjacent sections; the bytes of the second one
+        // must land after those of the first in the fetch buffer, not at its start
+        let section = |data: &[u8], base_address: usize| ImageSection {
+            data: data.to_vec(),
+            base_address,
+            perms: Perms {
+                read: true,
+                write: false,
+                exec: true,
+            },
+        };
+        let image = Image {
+            sections: vec![
+                section(&[0xb8, 0x04, 0x03], 0x1000),
+                section(&[0x02, 0x01], 0x1003),
+            ],
+        };
+        let ctx_builder =
+            SleighContextBuilder::load_ghidra_installation("/Applications/ghidra").unwrap();
+        let ctx = ctx_builder.set_image(image).build(SLEIGH_ARCH).unwrap();
+        let instr = ctx.read(0x1000, 1).last().unwrap();
+        assert_eq!(instr.length, 5);
+        assert!(instr.disassembly.mnemonic.eq("MOV"));
+        let op = PcodeOperation::Copy {
+            input: varnode!(&ctx, #0x01020304:4).unwrap(),
+            output: varnode!(&ctx, "register"[0]:4).unwrap(),
+        };
+        assert!(instr.ops.contains(&op))
+    }
 }
@@ -3,15 +3,15 @@ use std::collections::BTreeMap;
 use std::path::Path;
 
 pub struct SleighCompileParams {
-    defines: BTreeMap<String, String>,
-    unnecessary_pcode_warning: bool,
-    lenient_conflict: bool,
-    all_collision_warning: bool,
-    all_nop_warning: bool,
-    dead_temp_warning: bool,
-    enforce_local_keyword: bool,
-    large_temporary_warning: bool,
-    case_sensitive_register_names: bool,
+    pub defines: BTreeMap<String, String>,
+    pub unnecessary_pcode_warning: bool,
+    pub lenient_conflict: bool,
+    pub all_collision_warning: bool,
+    pub all_nop_warning: bool,
+    pub dead_temp_warning: bool,
+    pub enforce_local_keyword: bool,
+    pub large_temporary_warning: bool,
+    pub case_sensitive_register_names: bool,
 }
 
 pub fn compile(
@@ -19,7 +19,6 @@ pub fn compile(
     out_path: impl AsRef<Path>,
     params: Option<SleighCompileParams>,
 ) {
-    let _hi = Path::new("hi");
     if let Some(in_path) = in_path.as_ref().to_str() {
         if let Some(out_path) = out_path.as_ref().to_str() {
             bridge::compile(in_path, out_path, params.unwrap_or_default().into())
@@ -92,3 +91,20 @@ mod bridge {
 
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use crate::ffi::compile::compile;
+
+    #[test]
+    fn compile_slaspec() {
+        let out = std::env::temp_dir().join("jingle_sleigh_6502.sla");
+        let _ = std::fs::remove_file(&out);
+        compile(
+            "ghidra/Ghidra/Processors/6502/data/languages/6502.slaspec",
+            &out,
+            None,
+        );
+        assert!(out.metadata().is_ok_and(|m| m.len() > 0));
+    }
+}
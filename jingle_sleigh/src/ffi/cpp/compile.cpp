@@ -9,7 +9,7 @@ void compile(rust::Str infile, rust::Str outFile, CompileParams params) {
     std::map<std::string, std::string> defines;
     for (const auto &item: params.defines) {
         std::string name = item.name.operator std::string();
-        std::string value = item.name.operator std::string();
+        std::string value = item.value.operator std::string();
         defines[name] = value;
     }
     compiler.setAllOptions(defines, params.unnecessary_pcode_warning, params.lenient_conflict,
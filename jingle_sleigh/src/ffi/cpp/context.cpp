@@ -17,12 +17,13 @@ public:
         RawPcodeOp op;
         op.op = opc;
         op.has_output = false;
+        // the op's space is the same for every input, so only wrap it once
+        op.space = std::make_unique<AddrSpaceHandle>(addr.getSpace());
         if (outvar != nullptr && outvar->space != nullptr) {
             op.has_output = true;
             op.output.offset = outvar->offset;
             op.output.size = outvar->size;
             op.output.space = std::make_unique<AddrSpaceHandle>(AddrSpaceHandle(outvar->space));
-            outvar->space->getType();
         }
         op.inputs.reserve(isize);
         for (int i = 0; i < isize; i++) {
@@ -30,10 +31,9 @@ public:
             info.space = std::make_unique<AddrSpaceHandle>(vars[i].space);
             info.size = vars[i].size;
             info.offset = vars[i].offset;
-            op.space = std::make_unique<AddrSpaceHandle>(addr.getSpace());
             op.inputs.emplace_back(std::move(info));
         }
-        ops.emplace_back(op);
+        ops.emplace_back(std::move(op));
 
     }
 };
@@ -62,18 +62,21 @@ DummyLoadImage::DummyLoadImage(Image image) : ghidra::LoadImage("jingle") {
 }
 
 void DummyLoadImage::loadFill(ghidra::uint1 *ptr, ghidra::int4 size, const ghidra::Address &addr) {
-    size_t offset = addr.getOffset();
+    size_t base = addr.getOffset();
+    size_t offset = base;
     for (const auto &section: img.sections) {
         size_t start = section.base_address;
         size_t end = start + section.data.size();
         if (start <= offset && offset < end) {
-            size_t len = std::min((size_t) size, (size_t) end - (size_t) offset);
+            size_t filled = offset - base;
+            size_t len = std::min((size_t) size - filled, (size_t) end - (size_t) offset);
             size_t start_idx = offset - start;
-            std::memcpy(ptr, &section.data[start_idx], len);
+            std::memcpy(ptr + filled, &section.data[start_idx], len);
             offset = offset + len;
         }
     }
-    for (size_t i = offset; i < size; ++i) {
+    // ptr is indexed relative to addr, not by absolute offset
+    for (size_t i = offset - base; i < (size_t) size; ++i) {
         ptr[i] = 0;
     }
 }
@@ -1,5 +1,5 @@
 pub(crate) mod addrspace;
-#[cfg(compile)]
+#[cfg(feature = "compile")]
 pub(crate) mod compile;
 pub(crate) mod context_ffi;
 pub(crate) mod image;
@@ -9,6 +9,8 @@ pub(crate) mod varnode;
 
 pub use error::JingleSleighError;
 pub use ffi::addrspace::bridge::SpaceType;
+#[cfg(feature = "compile")]
+pub use ffi::compile::{compile, SleighCompileParams};
 pub use instruction::*;
 pub use pcode::*;
 pub use space::{RegisterManager, SleighEndianness, SpaceInfo, SpaceManager};
@@ -254,11 +254,12 @@ where
                     write!(f, "{} = ", output.display(self.spaces)?)?;
                 }
                 write!(f, "userop(")?;
-                let mut args = Vec::with_capacity(inputs.len());
-                for i in inputs {
-                    args.push(format!("{}", i.display(self.spaces)?));
+                for (idx, i) in inputs.iter().enumerate() {
+                    if idx > 0 {
+                        write!(f, ", ")?;
+                    }
+                    write!(f, "{}", i.display(self.spaces)?)?;
                 }
-                write!(f, "{}", args.join(", "))?;
                 write!(f, ")")
             }
             CallInd { input } => write!(f, "call [{}]", input.display(self.spaces)?),
@@ -274,7 +275,7 @@ where
             Call { input } => write!(f, "call {}", input.display(self.spaces)?),
             IntNegate { input, output } => write!(
                 f,
-                "{} =  ~{}",
+                "{} = ~{}",
                 output.display(self.spaces)?,
                 input.display(self.spaces)?
             ),
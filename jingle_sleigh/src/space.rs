@@ -101,16 +101,15 @@ pub trait SpaceManager {
 
     /// A helper function to generate a [`VarNode`] using the name of a space
     fn varnode(&self, name: &str, offset: u64, size: usize) -> Result<VarNode, JingleSleighError> {
-        for (space_index, space) in self.get_all_space_info().iter().enumerate() {
-            if space.name.eq(name) {
-                return Ok(VarNode {
-                    space_index,
-                    size,
-                    offset,
-                });
-            }
-        }
-        Err(JingleSleighError::InvalidSpaceName)
+        self.get_all_space_info()
+            .iter()
+            .position(|space| space.name == name)
+            .map(|space_index| VarNode {
+                space_index,
+                size,
+                offset,
+            })
+            .ok_or(JingleSleighError::InvalidSpaceName)
     }
 }
 
@@ -69,16 +69,7 @@ pub fn create_varnode<T: SpaceManager>(
     offset: u64,
     size: usize,
 ) -> Result<VarNode, JingleSleighError> {
-    for (space_index, space) in ctx.get_all_space_info().iter().enumerate() {
-        if space.name.eq(name) {
-            return Ok(VarNode {
-                space_index,
-                size,
-                offset,
-            });
-        }
-    }
-    Err(JingleSleighError::InvalidSpaceName)
+    ctx.varnode(name, offset, size)
 }
 
 #[derive(Debug, Clone, Hash, Eq, PartialEq, Serialize, Deserialize)]